@@ -0,0 +1,16 @@
+#!/usr/bin/env python
+
+"""
+The subpackage contains modules for phylogenetic analysis of shapes
+
+Examples
+--------
+>>> from phyloshape.phylo import Brownian
+
+Evaluate the negative log-likelihood of the branches of a tree:
+
+>>> Brownian().negloglike_array([sigma2], parent_states, child_states, dists)
+
+"""
+
+from phyloshape.phylo.src.models import MotionModel, Brownian
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+
+"""Models of shape vector evolution along the branches of a tree.
+
+"""
+
+from abc import ABC, abstractmethod
+import numpy as np
+from numpy.typing import ArrayLike
+from typing import Tuple
+
+
+class MotionModel(ABC):
+    """
+    Base class of the models of shape vector evolution.
+
+    A model evaluates the log density of the child states given the parent states over all
+    branches at once, from numpy arrays.
+    """
+    @abstractmethod
+    def get_parameters(self) -> ArrayLike:
+        pass
+
+    @abstractmethod
+    def log_density(
+            self,
+            params: ArrayLike,
+            parent_states: ArrayLike,
+            child_states: ArrayLike,
+            dists: ArrayLike) -> float:
+        """Log density of the child states given the parent states, summed over all branches.
+
+        Parameters
+        ----------
+        params: ArrayLike
+            Model parameters
+        parent_states: ArrayLike
+            Vectors of the parent node of each branch, in shape (n_branches, *vectors_shape)
+        child_states: ArrayLike
+            Vectors of the child node of each branch, in shape (n_branches, *vectors_shape)
+        dists: ArrayLike
+            Lengths of the branches, in shape (n_branches, ), validated by check_dists
+
+        Returns
+        -------
+        float
+        """
+        pass
+
+    @staticmethod
+    def check_dists(dists: ArrayLike) -> ArrayLike:
+        """Validate the branch lengths once, where the branch arrays are built.
+        The likelihood methods assume validated branch lengths and do not repeat the check.
+
+        Parameters
+        ----------
+        dists: ArrayLike
+            Lengths of the branches, in shape (n_branches, )
+
+        Returns
+        -------
+        ArrayLike
+            The branch lengths as a 1-D float array
+        """
+        dists = np.asarray(dists, dtype=float)
+        if dists.ndim != 1:
+            raise ValueError(f"Branch lengths must be a 1-D array, but shape {dists.shape} was found!")
+        if not np.all(dists > 0):
+            raise ValueError("Branch lengths must be positive! "
+                             "Zero-length branches should be collapsed or given a small length.")
+        return dists
+
+    def negloglike_array(
+            self,
+            params: ArrayLike,
+            parent_states: ArrayLike,
+            child_states: ArrayLike,
+            dists: ArrayLike) -> float:
+        """Negative log-likelihood of all branches, see log_density.
+        """
+        return -self.log_density(params, parent_states, child_states, dists)
+
+    def negloglike_grad_array(
+            self,
+            params: ArrayLike,
+            parent_states: ArrayLike,
+            child_states: ArrayLike,
+            dists: ArrayLike) -> Tuple[float, ArrayLike, ArrayLike, ArrayLike]:
+        """Negative log-likelihood of all branches together with its analytic gradient
+        with respect to params, parent_states and child_states.
+        Models without an analytic gradient raise NotImplementedError,
+        so that callers must explicitly fall back to finite differences.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not provide an analytic gradient!")
+
+
+class Brownian(MotionModel):
+    """
+    Brownian motion model of shape vector evolution.
+
+    Each vector component evolves independently with the rate sigma2, so that its change
+    along a branch of length t is normally distributed with mean 0 and variance sigma2 * t.
+    """
+    def __init__(self, sigma2: float = 1.):
+        self.sigma2 = sigma2
+
+    def get_parameters(self) -> ArrayLike:
+        return np.array([self.sigma2])
+
+    @staticmethod
+    def __branch_terms(
+            params: ArrayLike,
+            parent_states: ArrayLike,
+            child_states: ArrayLike,
+            dists: ArrayLike) -> Tuple[ArrayLike, ArrayLike, float, float]:
+        """Shared terms of the likelihood and its gradient:
+        the branch differences, the differences scaled by their variances,
+        the quadratic form and the log-determinant term.
+        """
+        diff = np.asarray(child_states) - np.asarray(parent_states)
+        if np.shape(dists) != (len(diff),):
+            raise ValueError(f"Branch lengths must be in shape ({len(diff)}, ), "
+                             f"but shape {np.shape(dists)} was found!")
+        # variance of each branch, broadcast over the vector components
+        var = params[0] * np.reshape(dists, (-1,) + (1,) * (diff.ndim - 1))
+        scaled_diff = diff / var
+        sq_term = np.sum(diff * scaled_diff)
+        log_term = diff[0].size * np.sum(np.log(2 * np.pi * var))
+        return diff, scaled_diff, sq_term, log_term
+
+    def log_density(
+            self,
+            params: ArrayLike,
+            parent_states: ArrayLike,
+            child_states: ArrayLike,
+            dists: ArrayLike) -> float:
+        """Log density of the child states given the parent states, summed over all branches.
+
+        Parameters
+        ----------
+        params: ArrayLike
+            Model parameters, (sigma2, )
+        parent_states: ArrayLike
+            Vectors of the parent node of each branch, in shape (n_branches, *vectors_shape)
+        child_states: ArrayLike
+            Vectors of the child node of each branch, in shape (n_branches, *vectors_shape)
+        dists: ArrayLike
+            Lengths of the branches, in shape (n_branches, ), validated by check_dists
+
+        Returns
+        -------
+        float
+            -inf if sigma2 is not positive, so that optimizers reject the step
+        """
+        if not params[0] > 0:
+            return -np.inf
+        diff, scaled_diff, sq_term, log_term = self.__branch_terms(params, parent_states, child_states, dists)
+        return -0.5 * (sq_term + log_term)
+
+    def negloglike_grad_array(
+            self,
+            params: ArrayLike,
+            parent_states: ArrayLike,
+            child_states: ArrayLike,
+            dists: ArrayLike) -> Tuple[float, ArrayLike, ArrayLike, ArrayLike]:
+        """Negative log-likelihood of all branches together with its analytic gradient,
+        e.g. to be used as the objective of scipy.optimize.minimize(..., jac=True).
+
+        Parameters
+        ----------
+        params: ArrayLike
+            Model parameters, (sigma2, )
+        parent_states: ArrayLike
+            Vectors of the parent node of each branch, in shape (n_branches, *vectors_shape)
+        child_states: ArrayLike
+            Vectors of the child node of each branch, in shape (n_branches, *vectors_shape)
+        dists: ArrayLike
+            Lengths of the branches, in shape (n_branches, ), validated by check_dists
+
+        Returns
+        -------
+        Tuple[float, ArrayLike, ArrayLike, ArrayLike]
+            negative log-likelihood,
+            gradient with respect to params, in shape (1, ),
+            gradient with respect to parent_states, in the shape of parent_states,
+            gradient with respect to child_states, in the shape of child_states.
+            Gradients of a node being the parent/child of multiple branches should be summed up by the caller.
+            If sigma2 is not positive, the negative log-likelihood is inf and the gradients are zeros,
+            so that optimizers reject the step.
+        """
+        if not params[0] > 0:
+            return np.inf, np.zeros(1), np.zeros(np.shape(parent_states)), np.zeros(np.shape(child_states))
+        diff, scaled_diff, sq_term, log_term = self.__branch_terms(params, parent_states, child_states, dists)
+        negloglike = 0.5 * (sq_term + log_term)
+        grad_sigma2 = 0.5 * (diff.size - sq_term) / params[0]
+        return negloglike, np.array([grad_sigma2]), -scaled_diff, scaled_diff
@@ -13,6 +13,9 @@ from typing import Union, List, Generator
 
 
 class Faces:
+    __slots__ = ("__vertex_ids", "__vertices", "__texture_ids", "__vertex_coords", "__vertex_coords_version",
+                 "__texture_coords", "texture_anchor_percent_coords", "texture_image_data", "__texture_anchor_coords")
+
     def __init__(self,
                  # TODO how to specify the dimension of the array/list
                  vertex_ids: Union[ArrayLike, List, None] = None,
@@ -20,8 +23,13 @@ class Faces:
                  texture_ids: Union[ArrayLike, List, None] = None,
                  texture_anchor_percent_coords: Union[ArrayLike, List, None] = None,
                  texture_image_data: ArrayLike = None):
+        # per-face coordinates, materialized lazily and reset whenever the ids or vertices are replaced,
+        # the vertex coordinates are also refreshed when the version of the vertices changes
+        self.__vertex_coords = None
+        self.__vertex_coords_version = None
+        self.__texture_coords = None
         self.vertex_ids = np.array([], dtype=ID_TYPE) if vertex_ids is None else np.array(vertex_ids, dtype=ID_TYPE)
-        self.__vertices = Vertices() if vertices is None else vertices
+        self.vertices = Vertices() if vertices is None else vertices
         self.texture_ids = np.array([], dtype=ID_TYPE) if texture_ids is None else np.array(texture_ids, dtype=ID_TYPE)
         self.texture_anchor_percent_coords = np.array([], dtype=COORD_TYPE) if texture_anchor_percent_coords is None \
             else np.array(texture_anchor_percent_coords, dtype=COORD_TYPE)
@@ -30,42 +38,114 @@ class Faces:
             self.texture_anchor_coords = None
         else:
             self.texture_anchor_coords = self.texture_anchor_percent_coords * self.texture_image_data.shape[:2]
+        # texture lookups always go through the per-face coordinates, so materialize them upfront
+        if self.texture_anchor_coords is not None and self.texture_ids.size:
+            self.__texture_coords = self.texture_anchor_coords[self.texture_ids]
 
     def __getitem__(self, item):
         return self.vertex_ids[item]
 
+    @property
+    def vertex_ids(self):
+        return self.__vertex_ids
+
+    @vertex_ids.setter
+    def vertex_ids(self, vertex_ids: ArrayLike):
+        self.__vertex_ids = vertex_ids
+        self.__vertex_coords = None
+
+    @property
+    def vertices(self):
+        return self.__vertices
+
+    @vertices.setter
+    def vertices(self, vertices: Vertices):
+        self.__vertices = vertices
+        self.__vertex_coords = None
+
+    @property
+    def texture_ids(self):
+        return self.__texture_ids
+
+    @texture_ids.setter
+    def texture_ids(self, texture_ids: ArrayLike):
+        self.__texture_ids = texture_ids
+        self.__texture_coords = None
+
+    @property
+    def texture_anchor_coords(self):
+        return self.__texture_anchor_coords
+
+    @texture_anchor_coords.setter
+    def texture_anchor_coords(self, texture_anchor_coords: ArrayLike):
+        self.__texture_anchor_coords = texture_anchor_coords
+        self.__texture_coords = None
+
+    @property
+    def vertex_coords(self):
+        """
+        The tri-coordinates of the three points of all faces, in shape (n_faces, 3, 3).
+        The cache follows reassignment of vertex_ids, vertices and vertices.coords,
+        but in-place edits of these arrays are not tracked; reassign them instead,
+        or use get_vertex_coords, which always reads the current coordinates.
+        """
+        if self.__vertex_coords is None or self.__vertex_coords_version != self.__vertices.version:
+            self.__vertex_coords = self.__vertices.coords[self.vertex_ids]
+            self.__vertex_coords_version = self.__vertices.version
+        return self.__vertex_coords
+
+    @property
+    def texture_coords(self):
+        """
+        The bi-coordinates of the three texture points of all faces, in shape (n_faces, 3, 2).
+        """
+        if self.__texture_coords is None and self.texture_anchor_coords is not None:
+            self.__texture_coords = self.texture_anchor_coords[self.texture_ids]
+        return self.__texture_coords
+
     # def __iter__(self):
     #     for vertex_id in self.vertex_ids:
     #         yield vertex_id
 
     def get_vertex_coords(self, face_id):
-        return self.__vertices[self.vertex_ids[face_id]]
+        return self.__vertices.coords[self.vertex_ids[face_id]]
 
     def get_texture_coords(self, face_id):
-        return self.texture_anchor_coords[self.texture_ids[face_id]]
+        return self.texture_coords[face_id]
 
     def iter_vertex_coords(self):
-        for vertex_id in self.vertex_ids:
-            yield self.__vertices[vertex_id]
+        """
+        Deprecated, use the array Faces.vertex_coords instead.
+        """
+        for coords in self.vertex_coords:
+            yield coords
 
     def iter_texture_coords(self):
-        for texture_id in self.texture_ids:
-            yield self.texture_anchor_coords[texture_id]
+        """
+        Deprecated, use the array Faces.texture_coords instead.
+        """
+        if self.texture_coords is None:
+            return
+        for coords in self.texture_coords:
+            yield coords
 
     def iter_coords(self, coord_type: str = "vertex"):
         """
         Returns a generator that each time generates the tri-coordinates (coord_type==vertex) or
         bi-coordinates (coord_type==texture) of the three points of a face.
+        Deprecated, use the arrays Faces.vertex_coords and Faces.texture_coords instead.
 
         :param coord_type: vertex (default) or texture
         :return: Generator[ArrayLike[ArrayLike, ArrayLike, ArrayLike]]
         """
         if coord_type == "vertex":
-            for vertex_id in self.vertex_ids:
-                yield self.__vertices[vertex_id]
+            for coords in self.vertex_coords:
+                yield coords
         elif coord_type == "texture":
-            for texture_id in self.texture_ids:
-                yield self.texture_anchor_coords[texture_id]
+            if self.texture_coords is None:
+                return
+            for coords in self.texture_coords:
+                yield coords
         else:
             raise ValueError(coord_type + " is not a valid input! coord_type must be either vertex or texture!")
 
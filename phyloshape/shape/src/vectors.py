@@ -10,7 +10,8 @@ from copy import deepcopy
 import random
 import numpy as np
 from numpy.typing import ArrayLike
-from phyloshape.utils import trans_vector_to_relative, trans_vector_to_absolute
+from phyloshape.utils import trans_vector_to_relative, trans_vector_to_absolute, ID_TYPE, COORD_TYPE
+from phyloshape.shape.src.vertex import Vertices
 
 
 class VectorHandler:
@@ -154,6 +155,10 @@ class VertexVectorMapper:
         # Should find out where it is and optimize it.
         self.random_seed = random_seed
         self.__update(face_indices)
+        # index arrays of the vector handlers, for vectorized access to the coordinates
+        self.__from_ids = np.array([vh.from_id for vh in self.__vh_list], dtype=ID_TYPE)
+        self.__to_ids = np.array([vh.to_id for vh in self.__vh_list], dtype=ID_TYPE)
+        self.__from_faces = np.array([vh.from_face for vh in self.__vh_list[1:]], dtype=ID_TYPE)
 
     def __update(
             self,
@@ -276,38 +281,85 @@ class VertexVectorMapper:
         Parameters
         ----------
         vertices:
-            Array of triangle vertices: float (x, y, z) coordinate triplets.
+            Vertices, or array of triangle vertices: float (x, y, z) coordinate triplets.
 
         Returns
         -------
         vectors
             ArrayLike
         """
-        # initialize with the first & second vectors
-        norm_v1 = np.linalg.norm(vertices[self.__vh_list[0].target_id] - vertices[self.__vh_list[0].from_id])
-        vectors = [np.array([norm_v1, 0, 0])]
+        if isinstance(vertices, Vertices):
+            vertices = vertices.coords
+        return self.to_vectors_batch(np.asarray(vertices)[np.newaxis])[0]
+
+    def to_vectors_batch(self, coords_stack: ArrayLike) -> ArrayLike:
+        """Batched version of to_vectors, generating the representative vectors of multiple shapes at once.
+
+        Parameters
+        ----------
+        coords_stack:
+            Array of vertex coordinates of multiple shapes, in shape (n_shapes, n_vertices, 3).
+
+        Returns
+        -------
+        vectors
+            ArrayLike in shape (n_shapes, n_vectors, 3)
+        """
+        coords_stack = np.asarray(coords_stack)
+        vectors = np.zeros((len(coords_stack), len(self.__vh_list), 3),
+                           dtype=np.result_type(coords_stack, COORD_TYPE))
+        # initialize with the first vector
+        vectors[:, 0, 0] = np.linalg.norm(
+            coords_stack[:, self.__to_ids[0]] - coords_stack[:, self.__from_ids[0]], axis=-1)
         # do the following vectors
-        for vh in self.__vh_list[1:]:
-            vector_in_space = vertices[vh.target_id] - vertices[vh.from_id]
-            relative_vector = trans_vector_to_relative(vector_in_space, vertices[list(vh.from_face)])
-            vectors.append(relative_vector)
-        return np.array(vectors)
+        vectors_in_space = coords_stack[:, self.__to_ids[1:]] - coords_stack[:, self.__from_ids[1:]]
+        vectors[:, 1:] = trans_vector_to_relative(vectors_in_space, coords_stack[:, self.__from_faces])
+        return vectors
 
     def to_vertices(self, vectors) -> ArrayLike:
-        assert len(vectors) == len(self.__vh_list), \
+        """Based on the mapping information, it takes representative vectors to rebuild the vertices of a shape
+
+        Parameters
+        ----------
+        vectors:
+            Array of representative vectors, in shape (n_vectors, 3).
+
+        Returns
+        -------
+        vertices
+            ArrayLike in shape (n_vectors + 1, 3)
+        """
+        return self.to_vertices_batch(np.asarray(vectors)[np.newaxis])[0]
+
+    def to_vertices_batch(self, vectors_stack: ArrayLike) -> ArrayLike:
+        """Batched version of to_vertices, rebuilding the vertices of multiple shapes at once.
+        The vector handlers are walked once, each step being applied to all shapes.
+
+        Parameters
+        ----------
+        vectors_stack:
+            Array of representative vectors of multiple shapes, in shape (n_shapes, n_vectors, 3).
+
+        Returns
+        -------
+        vertices
+            ArrayLike in shape (n_shapes, n_vectors + 1, 3)
+        """
+        vectors_stack = np.asarray(vectors_stack)
+        assert vectors_stack.shape[1] == len(self.__vh_list), \
             "The length of the vectors must equals the length of absolute_vector handlers!"
-        vertices = np.array([np.array([None, None, None])] * (len(vectors) + 1), dtype=np.float32)
-        vertices[self.__vh_list[0].from_id] = [0., 0., 0.]
-        vertices[self.__vh_list[0].target_id] = vectors[0]
-        vertices[self.__vh_list[1].target_id] = vectors[0] + vectors[1]
-        for go_vct, vh in enumerate(self.__vh_list[2:]):
-            relative_vector = vectors[go_vct]
-            vector_in_space = trans_vector_to_absolute(relative_vector, vertices[list(vh.from_face)])
-            if np.isnan(vertices[vh.from_id]).any():
-                raise ValueError(f"While building Vtx {vh.target_id}, Vtx {vh.from_id} is invalid {vertices[vh.from_id]}!")
-            else:
-                vertices[vh.target_id] = vertices[vh.from_id] + vector_in_space
-        return np.array(vertices)
+        vertices = np.full((len(vectors_stack), len(self.__vh_list) + 1, 3), np.nan, dtype=COORD_TYPE)
+        vertices[:, self.__from_ids[0]] = 0.
+        vertices[:, self.__to_ids[0]] = vectors_stack[:, 0]
+        vertices[:, self.__to_ids[1]] = vectors_stack[:, 0] + vectors_stack[:, 1]
+        for go_vct in range(2, len(self.__vh_list)):
+            from_id = self.__from_ids[go_vct]
+            if np.isnan(vertices[:, from_id]).any():
+                raise ValueError(f"While building Vtx {self.__to_ids[go_vct]}, Vtx {from_id} is invalid!")
+            vector_in_space = trans_vector_to_absolute(
+                vectors_stack[:, go_vct], vertices[:, self.__from_faces[go_vct - 1]])
+            vertices[:, self.__to_ids[go_vct]] = vertices[:, from_id] + vector_in_space
+        return vertices
 
     def vh_list(self):
         return deepcopy(self.__vh_list)
@@ -12,27 +12,35 @@ from typing import Union, List
 
 
 class Vertices:
+    __slots__ = ("__coords", "colors", "version")
+
     def __init__(self,
                  # TODO how to specify the dimension of the array/list
                  coords: Union[ArrayLike, List, None] = None,
                  colors: Union[ArrayLike, List, None] = None):
+        # bumped whenever coords is reassigned, so that dependent caches (e.g. Faces.vertex_coords) can refresh
+        self.version = 0
         self.coords = np.array([], dtype=COORD_TYPE) if coords is None else np.array(coords, dtype=COORD_TYPE)
         self.colors = np.array([], dtype=RGB_TYPE) if colors is None else np.array(colors, dtype=RGB_TYPE)
         assert len(self.coords) == len(self.colors)
 
+    @property
+    def coords(self):
+        return self.__coords
+
+    @coords.setter
+    def coords(self, coords: ArrayLike):
+        self.__coords = coords
+        self.version += 1
+
     def __getitem__(self, item):
         return self.coords[item]
 
     def __bool__(self):
-        return bool(self.coords)
+        return self.coords.size > 0
 
     def __iter__(self):
-        if self.coords and self.colors:
-            for coord, color in zip(self.coords and self.colors):
-                yield coord, color
-        else:
-            for coord in self.coords:
-                yield coord
+        return zip(self.coords, self.colors) if self.colors.size else iter(self.coords)
 
     def __len__(self):
         return len(self.coords)
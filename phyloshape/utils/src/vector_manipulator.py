@@ -18,20 +18,24 @@ def gen_unit_perpendicular_v(
     Parameters
     ----------
     three_points: List[ArrayLike]
-        Three elements of coordinate triplets, each is an arrays of np.float32 (x, y, z)
+        Three elements of coordinate triplets, each is an arrays of np.float32 (x, y, z).
+        Stacks of planes in shape (..., 3, 3) are also accepted.
 
     Returns
     -------
     ArrayLike[np.float32, np.float32, np.float32]
-        Array of np.float32 (x, y, z) coordinate triplet
+        Array of np.float32 (x, y, z) coordinate triplet, or in shape (..., 3) for stacked planes
     """
-    a = three_points[0] - three_points[1]
-    b = three_points[0] - three_points[2]
-    perpendicular_v = np.array([a[1]*b[2]-a[2]*b[1],
-                                a[2]*b[0]-a[0]*b[2],
-                                a[0]*b[1]-a[1]*b[0]])
-    norm = np.linalg.norm(perpendicular_v)
-    return perpendicular_v if norm == 0 else perpendicular_v/norm
+    three_points = np.asarray(three_points)
+    # compute in floating point, so that integer coordinates are also accepted
+    three_points = three_points.astype(np.result_type(three_points, np.float32), copy=False)
+    a = three_points[..., 0, :] - three_points[..., 1, :]
+    b = three_points[..., 0, :] - three_points[..., 2, :]
+    perpendicular_v = np.stack([a[..., 1]*b[..., 2]-a[..., 2]*b[..., 1],
+                                a[..., 2]*b[..., 0]-a[..., 0]*b[..., 2],
+                                a[..., 0]*b[..., 1]-a[..., 1]*b[..., 0]], axis=-1)
+    norm = np.linalg.norm(perpendicular_v, axis=-1, keepdims=True)
+    return np.divide(perpendicular_v, norm, out=perpendicular_v, where=norm != 0)
 
 
 #TODO how to indicate the elements should be [np.float32, np.float32, np.float32]?
@@ -47,8 +51,10 @@ def trans_vector_to_relative(
     ----------
     absolute_vector: ArrayLike[np.float32]
         Array of triangle vertices: float (x, y, z) coordinate triplets.
+        Stacks of vectors in shape (..., 3) are also accepted.
     ref_face_points: List[ArrayLike[np.float32]]
-        List of three coordinate triplets, each is an arrays of np.float32 (x, y, z)
+        List of three coordinate triplets, each is an arrays of np.float32 (x, y, z).
+        For stacked vectors, the matching stack of faces in shape (..., 3, 3).
 
     Returns
     -------
@@ -56,16 +62,17 @@ def trans_vector_to_relative(
         Array of triangle vertices: float (x, y, z) coordinate triplets.
     """
     # new_vector = np.array(absolute_vector, dtype=absolute_vector.dtype)
-    vx, vy, vz = absolute_vector
+    absolute_vector = np.asarray(absolute_vector)
+    vx, vy, vz = absolute_vector[..., 0], absolute_vector[..., 1], absolute_vector[..., 2]
     perpendicular_v = gen_unit_perpendicular_v(ref_face_points)
 
     # 1. calculate rotations to transform the perpendicular_v into (0, 0, 1)
-    norm_yz = np.linalg.norm(perpendicular_v[1:])
+    norm_yz = np.linalg.norm(perpendicular_v[..., 1:], axis=-1)
     # the angle to rotate along the x axis
-    sin_x_theta = perpendicular_v[1] / norm_yz
-    cos_x_theta = perpendicular_v[2] / norm_yz
+    sin_x_theta = perpendicular_v[..., 1] / norm_yz
+    cos_x_theta = perpendicular_v[..., 2] / norm_yz
     # the angle to rotate along the y axis
-    sin_y_theta = perpendicular_v[0]
+    sin_y_theta = perpendicular_v[..., 0]
     cos_y_theta = norm_yz
 
     # 2. apply the rotations to the input absolute_vector
@@ -79,7 +86,7 @@ def trans_vector_to_relative(
     new_vz = vx * sin_y_theta + new_vz * cos_y_theta
 
     # return new_vector
-    return np.array([new_vx, new_vy, new_vz])
+    return np.stack([new_vx, new_vy, new_vz], axis=-1)
 
 
 #TODO how to indicate the elements should be [np.float32, np.float32, np.float32]?
@@ -94,25 +101,28 @@ def trans_vector_to_absolute(
     ----------
     relative_vector: ArrayLike[np.float32]
         Array of triangle vertices: float (x, y, z) coordinate triplets.
+        Stacks of vectors in shape (..., 3) are also accepted.
     ref_face_points: List[ArrayLike[np.float32]]
-        List of three coordinate triplets, each is an arrays of np.float32 (x, y, z)
+        List of three coordinate triplets, each is an arrays of np.float32 (x, y, z).
+        For stacked vectors, the matching stack of faces in shape (..., 3, 3).
 
     Returns
     -------
     ArrayLike[np.float32]
         Array of triangle vertices: float (x, y, z) coordinate triplets.
     """
-    vx, vy, vz = relative_vector
+    relative_vector = np.asarray(relative_vector)
+    vx, vy, vz = relative_vector[..., 0], relative_vector[..., 1], relative_vector[..., 2]
     perpendicular_v = gen_unit_perpendicular_v(ref_face_points)
 
     # 1. calculate rotations to transform (0, 0, 1) into the perpendicular_v
-    norm_yz = np.linalg.norm(perpendicular_v[1:])
+    norm_yz = np.linalg.norm(perpendicular_v[..., 1:], axis=-1)
     # the angle to rotate along the y axis
-    sin_y_theta = -perpendicular_v[0]
+    sin_y_theta = -perpendicular_v[..., 0]
     cos_y_theta = norm_yz
     # the angle to rotate along the x axis
-    sin_x_theta = -perpendicular_v[1] / norm_yz
-    cos_x_theta = perpendicular_v[2] / norm_yz
+    sin_x_theta = -perpendicular_v[..., 1] / norm_yz
+    cos_x_theta = perpendicular_v[..., 2] / norm_yz
 
     # 2. apply the rotations to the input relative_vector
     new_vx = vx * cos_y_theta - vz * sin_y_theta
@@ -120,7 +130,7 @@ def trans_vector_to_absolute(
     new_vy = vy * cos_x_theta - new_vz * sin_x_theta
     new_vz = vy * sin_x_theta + new_vz * cos_x_theta
 
-    return np.array([new_vx, new_vy, new_vz])
+    return np.stack([new_vx, new_vy, new_vz], axis=-1)
 
 
 
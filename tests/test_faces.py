@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+"""Tests of the Faces container.
+
+"""
+
+import numpy as np
+from phyloshape.shape import Faces, Vertices
+
+
+def toy_faces():
+    vertices = Vertices(coords=np.eye(4, 3), colors=np.zeros((4, 3)))
+    return Faces(vertex_ids=[[0, 1, 2], [1, 2, 3]], vertices=vertices), vertices
+
+
+def test_vertex_coords():
+    faces, vertices = toy_faces()
+    assert faces.vertex_coords.shape == (2, 3, 3)
+    assert np.allclose(faces.vertex_coords[1], vertices.coords[[1, 2, 3]])
+
+
+def test_vertex_coords_follow_reassigned_coords():
+    faces, vertices = toy_faces()
+    assert np.allclose(faces.vertex_coords[0, 0], [1, 0, 0])
+    vertices.coords = vertices.coords * 5
+    assert np.allclose(faces.vertex_coords[0, 0], [5, 0, 0])
+    faces.vertex_ids = np.array([[3, 2, 1]])
+    assert np.allclose(faces.vertex_coords[0], vertices.coords[[3, 2, 1]])
+
+
+def test_get_vertex_coords_is_live():
+    faces, vertices = toy_faces()
+    assert np.allclose(faces.vertex_coords[0, 0], [1, 0, 0])
+    vertices.coords[0] = [7, 0, 0]
+    assert np.allclose(faces.get_vertex_coords(0)[0], [7, 0, 0])
+
+
+def test_texture_coords_follow_reassigned_anchors():
+    faces = Faces(vertex_ids=[[0, 1, 2]], texture_ids=[[0, 1, 2]],
+                  texture_anchor_percent_coords=[[0, 0], [0.5, 0], [0, 0.5]],
+                  texture_image_data=np.zeros((10, 10, 3)))
+    assert np.allclose(faces.get_texture_coords(0)[1], [5, 0])
+    faces.texture_anchor_coords = faces.texture_anchor_coords * 2
+    assert np.allclose(faces.get_texture_coords(0)[1], [10, 0])
+    assert np.allclose(list(faces.iter_coords("texture"))[0][1], [10, 0])
+
+
+def test_no_texture():
+    assert Faces().texture_coords is None
+    assert list(Faces().iter_texture_coords()) == []
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+"""Tests of the models of shape vector evolution.
+
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+from scipy.optimize import check_grad
+from phyloshape.phylo import MotionModel, Brownian
+
+
+def toy_branches(n_branches: int = 5, seed: int = 0):
+    """Random parent/child states of shape (n_branches, 4, 3) and positive branch lengths."""
+    rng = np.random.default_rng(seed)
+    parent_states = rng.normal(size=(n_branches, 4, 3))
+    child_states = rng.normal(size=(n_branches, 4, 3))
+    dists = rng.uniform(0.1, 1., size=n_branches)
+    return parent_states, child_states, dists
+
+
+def test_negloglike_matches_normal_logpdf():
+    parent_states, child_states, dists = toy_branches()
+    sigma2 = 0.7
+    expected = -norm.logpdf(child_states, parent_states, np.sqrt(sigma2 * dists)[:, None, None]).sum()
+    model = Brownian()
+    assert np.isclose(model.negloglike_array([sigma2], parent_states, child_states, dists), expected)
+    assert np.isclose(model.negloglike_grad_array([sigma2], parent_states, child_states, dists)[0], expected)
+
+
+def test_gradients():
+    parent_states, child_states, dists = toy_branches()
+    sigma2 = 0.7
+    model = Brownian()
+    shape = parent_states.shape
+
+    def f_sigma2(x):
+        return model.negloglike_array(x, parent_states, child_states, dists)
+
+    def g_sigma2(x):
+        return model.negloglike_grad_array(x, parent_states, child_states, dists)[1]
+
+    def f_parent(x):
+        return model.negloglike_array([sigma2], x.reshape(shape), child_states, dists)
+
+    def g_parent(x):
+        return model.negloglike_grad_array([sigma2], x.reshape(shape), child_states, dists)[2].ravel()
+
+    def f_child(x):
+        return model.negloglike_array([sigma2], parent_states, x.reshape(shape), dists)
+
+    def g_child(x):
+        return model.negloglike_grad_array([sigma2], parent_states, x.reshape(shape), dists)[3].ravel()
+
+    assert check_grad(f_sigma2, g_sigma2, [sigma2]) < 1e-4
+    assert check_grad(f_parent, g_parent, parent_states.ravel()) < 1e-4
+    assert check_grad(f_child, g_child, child_states.ravel()) < 1e-4
+
+
+def test_non_positive_sigma2_is_rejected_not_raised():
+    parent_states, child_states, dists = toy_branches()
+    model = Brownian()
+    assert model.negloglike_array([0.], parent_states, child_states, dists) == np.inf
+    assert model.negloglike_grad_array([-1.], parent_states, child_states, dists)[0] == np.inf
+
+
+def test_dists_must_match_branches():
+    parent_states, child_states, dists = toy_branches()
+    with pytest.raises(ValueError):
+        Brownian().negloglike_array([0.7], parent_states, child_states, dists[:1])
+    with pytest.raises(ValueError):
+        Brownian().negloglike_array([0.7], parent_states, child_states, 0.5)
+
+
+def test_check_dists():
+    assert Brownian.check_dists([0.5, 1]).dtype == float
+    with pytest.raises(ValueError):
+        Brownian.check_dists([0.5, 0.])
+
+
+def test_motion_model_interface():
+    class NoLogDensity(MotionModel):
+        def get_parameters(self):
+            return np.array([])
+
+    class NoGradient(NoLogDensity):
+        def log_density(self, params, parent_states, child_states, dists):
+            return 0.
+
+    with pytest.raises(TypeError):
+        NoLogDensity()
+    parent_states, child_states, dists = toy_branches()
+    with pytest.raises(NotImplementedError):
+        NoGradient().negloglike_grad_array([], parent_states, child_states, dists)
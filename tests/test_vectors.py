@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+"""Tests of the conversion between vertices and vectors.
+
+"""
+
+import numpy as np
+from phyloshape.shape import VertexVectorMapper
+
+
+def toy_grid(n: int = 5, seed: int = 0):
+    """A triangulated n x n grid in the canonical frame of VertexVectorMapper:
+    the first vertex at the origin, the second on the +x axis and the first face on the xy plane,
+    with the remaining vertices lifted off the plane at random.
+    """
+    faces = []
+    for i in range(n - 1):
+        for j in range(n - 1):
+            a = i * n + j
+            faces += [(a, a + 1, a + n), (a + 1, a + n + 1, a + n)]
+    coords = np.array([(j, i, 0.) for i in range(n) for j in range(n)], dtype=np.float32)
+    coords[:, 2] = np.random.default_rng(seed).normal(scale=0.3, size=len(coords))
+    coords[list(faces[0]), 2] = 0.
+    return np.array(faces), coords
+
+
+def test_round_trip():
+    faces, coords = toy_grid()
+    mapper = VertexVectorMapper(faces)
+    vectors = mapper.to_vectors(coords)
+    assert np.allclose(mapper.to_vertices(vectors), coords, atol=1e-5)
+
+
+def test_batch_matches_single():
+    faces, coords = toy_grid()
+    mapper = VertexVectorMapper(faces)
+    coords_stack = np.stack([coords * scale for scale in (1., 1.5, 2.)])
+    vectors_stack = mapper.to_vectors_batch(coords_stack)
+    vertices_stack = mapper.to_vertices_batch(vectors_stack)
+    for coords_i, vectors_i, vertices_i in zip(coords_stack, vectors_stack, vertices_stack):
+        assert np.allclose(mapper.to_vectors(coords_i), vectors_i)
+        assert np.allclose(mapper.to_vertices(vectors_i), vertices_i)
+        assert np.allclose(vertices_i, coords_i, atol=1e-5)
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+
+"""Tests of the Vertices container.
+
+"""
+
+import numpy as np
+from phyloshape.shape import Vertices
+
+
+def test_bool():
+    assert not Vertices()
+    assert Vertices(coords=np.ones((3, 3)), colors=np.zeros((3, 3)))
+
+
+def test_iter_with_colors():
+    coords = np.arange(6).reshape(2, 3)
+    colors = np.array([[255, 0, 0], [0, 255, 0]])
+    pairs = list(Vertices(coords=coords, colors=colors))
+    assert len(pairs) == 2
+    for (coord, color), exp_coord, exp_color in zip(pairs, coords, colors):
+        assert np.allclose(coord, exp_coord)
+        assert np.array_equal(color, exp_color)